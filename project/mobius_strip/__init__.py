@@ -3,6 +3,6 @@ Mobius strip modeling package.
 """
 
 from .mobius_strip import MobiusStrip
-from .visualization import plot_mobius_strip, interactive_plot
+from .visualization import plot_mobius_strip, update_mobius_artist, interactive_plot
 
-__all__ = ['MobiusStrip', 'plot_mobius_strip', 'interactive_plot']
\ No newline at end of file
+__all__ = ['MobiusStrip', 'plot_mobius_strip', 'update_mobius_artist', 'interactive_plot']
\ No newline at end of file
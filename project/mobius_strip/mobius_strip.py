@@ -3,8 +3,90 @@ Mobius strip implementation with parametric equations and geometric calculations
 """
 
 import numpy as np
+from math import pi, sqrt
 from typing import Tuple, Optional
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional, fall back to plain NumPy
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional, fall back to plain NumPy
+    ne = None
+
+
+def _simpson_weights(n: int) -> np.ndarray:
+    """
+    Build composite Simpson quadrature weights for n equally spaced samples.
+    
+    An even number of samples leaves an odd number of intervals, so the last
+    three intervals are covered by Simpson's 3/8 rule instead. The weights
+    are for unit spacing and only depend on n.
+    
+    Args:
+        n (int): Number of samples.
+    
+    Returns:
+        np.ndarray: The weights, such that ``np.dot(weights, f) * dx``
+        integrates f sampled with spacing dx.
+    """
+    weights = np.zeros(n)
+    if n < 3:
+        # Too few samples for Simpson's rule, fall back to the trapezoidal rule
+        weights[:] = 1.0
+        weights[[0, -1]] = 0.5
+        return weights
+    
+    # Number of samples handled by the 1/3 rule (must be odd)
+    m = n if n % 2 == 1 else n - 3
+    if m > 1:
+        weights[:m] = 2.0
+        weights[1:m - 1:2] = 4.0
+        weights[[0, m - 1]] = 1.0
+        weights[:m] /= 3
+    if m < n:
+        weights[m - 1:] += np.array([1.0, 3.0, 3.0, 1.0]) * (3 / 8)
+    return weights
+
+
+def _check_resolution(resolution: int):
+    """Raise a ValueError unless the mesh has at least two points per axis."""
+    # The step sizes divide by (resolution - 1)
+    if resolution < 2:
+        raise ValueError(f"resolution must be at least 2, got {resolution}")
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _area_kernel(radius, v_range, cos_hu, w_u, w_v):
+        """
+        Fused surface area integral, evaluated in a single pass over the grid.
+        
+        Args:
+            radius (float): Distance from the center to the strip.
+            v_range (np.ndarray): Samples of v, shape (N_v,).
+            cos_hu (np.ndarray): cos(u/2) sampled over u, shape (N_u,).
+            w_u (np.ndarray): Unit-spacing quadrature weights over u, shape (N_u,).
+            w_v (np.ndarray): Unit-spacing quadrature weights over v, shape (N_v,).
+        
+        Returns:
+            float: The weighted sum, to be scaled by the area element du*dv.
+        """
+        total = 0.0
+        for i in prange(v_range.shape[0]):
+            v = v_range[i]
+            quarter_v2 = 0.25 * v * v
+            row = 0.0
+            for j in range(cos_hu.shape[0]):
+                rfac = radius + v * cos_hu[j]
+                row += w_u[j] * sqrt(rfac * rfac + quarter_v2)
+            total += w_v[i] * row
+        return total
+else:
+    _area_kernel = None
+
 
 class MobiusStrip:
     """
@@ -24,36 +106,78 @@ class MobiusStrip:
             radius (float): Distance from the center to the strip.
             width (float): Width of the strip.
             resolution (int): Number of points in the mesh for each parameter.
+        
+        Raises:
+            ValueError: If resolution is less than 2.
         """
+        _check_resolution(resolution)
         self.radius = radius
         self.width = width
         self.resolution = resolution
         
         # Initialize mesh coordinates
-        self.u_range = np.linspace(0, 2 * np.pi, resolution)
+        self.u_range = np.linspace(0, 2 * pi, resolution)
         self.v_range = np.linspace(-width / 2, width / 2, resolution)
         
-        # Pre-compute mesh grid for faster calculations
+        # Last computed surface area, keyed on (radius, width, resolution)
+        self._area_cache = None
+        
+        # Pre-compute trig tables and coordinates for faster calculations
         self._update_mesh()
     
     def _update_mesh(self):
-        """Update the mesh grid based on current parameters."""
-        self.u_grid, self.v_grid = np.meshgrid(self.u_range, self.v_range)
-        self._compute_coordinates()
+        """Update the mesh based on current parameters."""
+        # No full meshgrid is built: the 1-D u tables (shape (N,)) broadcast
+        # against the v column (shape (N, 1)) wherever a grid is needed
+        self._precompute_trig()
+        self._allocate_buffers()
+        self._precompute_v()
+        self._compose_xyz()
+    
+    def _precompute_trig(self):
+        """Cache the trig tables and the quadrature weights."""
+        # The trig tables only depend on the resolution and are shared by the
+        # coordinate and surface area calculations
+        half_u = self.u_range / 2
+        self._cos_u = np.cos(self.u_range)
+        self._sin_u = np.sin(self.u_range)
+        self._cos_hu = np.cos(half_u)
+        self._sin_hu = np.sin(half_u)
+        
+        # The unit-spacing quadrature weights only depend on the resolution.
+        # Their (N_v, N_u) outer product is only needed by the array paths of
+        # calculate_surface_area, so it is built on first use
+        self._w_u = _simpson_weights(self.resolution)
+        self._w_v = self._w_u
+        self._weights = None
+    
+    def _allocate_buffers(self):
+        """Allocate the output buffers for the coordinates."""
+        # Only called when the resolution changes; other updates reuse them
+        shape = (self.resolution, self.resolution)
+        self.x = np.empty(shape)
+        self.y = np.empty(shape)
+        self.z = np.empty(shape)
+        self._tmp = np.empty(shape)
+    
+    def _precompute_v(self):
+        """Cache the v column and the area element."""
+        self.v_col = self.v_range[:, None]
+        
+        # Scalar step sizes, computed without indexing into the arrays
+        self._du = 2 * pi / (self.resolution - 1)
+        self._dv = self.width / (self.resolution - 1)
+        self._dA = self._du * self._dv
     
-    def _compute_coordinates(self):
+    def _compose_xyz(self):
         """Compute the (x, y, z) coordinates using the parametric equations."""
-        # Compute intermediate values
-        half_u = self.u_grid / 2
-        cos_half_u = np.cos(half_u)
-        sin_half_u = np.sin(half_u)
-        cos_u = np.cos(self.u_grid)
-        sin_u = np.sin(self.u_grid)
-        
-        # Apply parametric equations
-        self.x = (self.radius + self.v_grid * cos_half_u) * cos_u
-        self.y = (self.radius + self.v_grid * cos_half_u) * sin_u
-        self.z = self.v_grid * sin_half_u
+        # Apply parametric equations, broadcasting v over the cached u tables
+        # and writing into the preallocated buffers
+        rfac = np.multiply(self.v_col, self._cos_hu, out=self._tmp)
+        rfac += self.radius
+        np.multiply(rfac, self._cos_u, out=self.x)
+        np.multiply(rfac, self._sin_u, out=self.y)
+        np.multiply(self.v_col, self._sin_hu, out=self.z)
     
     def update_parameters(self, radius: Optional[float] = None, 
                           width: Optional[float] = None, 
@@ -65,50 +189,127 @@ class MobiusStrip:
             radius (float, optional): New radius value.
             width (float, optional): New width value.
             resolution (int, optional): New resolution value.
+        
+        Raises:
+            ValueError: If resolution is less than 2.
         """
-        if radius is not None:
+        if resolution is not None:
+            _check_resolution(resolution)
+        
+        # Track which cached quantities are invalidated: the radius only
+        # enters the coordinates, the width also moves v, and the resolution
+        # changes every table
+        changed = False
+        v_changed = False
+        u_changed = False
+        if radius is not None and radius != self.radius:
             self.radius = radius
-        if width is not None:
+            changed = True
+        if width is not None and width != self.width:
             self.width = width
             self.v_range = np.linspace(-width / 2, width / 2, self.resolution)
-        if resolution is not None:
+            changed = v_changed = True
+        if resolution is not None and resolution != self.resolution:
             self.resolution = resolution
-            self.u_range = np.linspace(0, 2 * np.pi, resolution)
+            self.u_range = np.linspace(0, 2 * pi, resolution)
             self.v_range = np.linspace(-self.width / 2, self.width / 2, resolution)
+            changed = v_changed = u_changed = True
         
-        # Update the mesh with new parameters
-        self._update_mesh()
+        # Only recompute what a changed parameter actually affects
+        if u_changed:
+            self._precompute_trig()
+            self._allocate_buffers()
+        if v_changed:
+            self._precompute_v()
+        if changed:
+            self._compose_xyz()
+    
+    @property
+    def bounds(self) -> Tuple[float, float, float, float, float, float]:
+        """
+        Analytic bounding box of the Mobius strip, centered at the origin.
+        
+        Since |R + v*cos(u/2)| <= R + w/2 and |v*sin(u/2)| <= w/2, the strip
+        lies within these limits without scanning the mesh.
+        
+        Returns:
+            Tuple[float, ...]: (x_min, x_max, y_min, y_max, z_min, z_max).
+        """
+        m = self.radius + self.width / 2
+        h = self.width / 2
+        return (-m, m, -m, m, -h, h)
     
     def get_coordinates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Get the (x, y, z) coordinates of the Mobius strip.
         
+        The arrays are updated in place by update_parameters; copy them to
+        keep the coordinates of a previous configuration.
+        
         Returns:
             Tuple[np.ndarray, np.ndarray, np.ndarray]: The x, y, and z coordinates.
         """
         return self.x, self.y, self.z
     
-    def get_edge_points(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def get_display_coordinates(self, nu: int = 40, nv: int = 20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Get the coordinates of points along the edges of the Mobius strip.
+        Get (x, y, z) coordinates of the Mobius strip on a coarse display mesh.
+        
+        The surface is smooth, so plotting needs far fewer points than the
+        integration mesh; this mesh is independent of the resolution.
+        
+        Args:
+            nu (int, optional): Number of points along u.
+            nv (int, optional): Number of points along v.
         
         Returns:
-            Tuple[np.ndarray, np.ndarray, np.ndarray]: Edge points coordinates (x, y, z).
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The x, y, and z coordinates,
+            each of shape (nv, nu).
         """
-        # Get edge indices (first and last rows of v_grid)
-        v_min_idx = 0
-        v_max_idx = self.resolution - 1
+        return self._compute_display_coordinates(nu, nv)
+    
+    def _compute_display_coordinates(self, nu: int, nv: int, dtype=np.float32):
+        """
+        Compute the display mesh coordinates in the given precision.
         
-        # Extract edge points
-        edge1_x = self.x[v_min_idx, :]
-        edge1_y = self.y[v_min_idx, :]
-        edge1_z = self.z[v_min_idx, :]
+        Matplotlib does not need double precision to draw the surface, and
+        NumPy's float32 sin/cos loops are faster than the float64 ones, so the
+        render path defaults to float32. The integrals stay in float64.
+        """
+        scalar = np.dtype(dtype).type
+        u = np.linspace(0, 2 * pi, nu, dtype=dtype)
+        v_col = np.linspace(-self.width / 2, self.width / 2, nv, dtype=dtype)[:, None]
+        half_u = u / scalar(2)
         
-        edge2_x = self.x[v_max_idx, :]
-        edge2_y = self.y[v_max_idx, :]
-        edge2_z = self.z[v_max_idx, :]
+        rfac = scalar(self.radius) + v_col * np.cos(half_u)
+        x = rfac * np.cos(u)
+        y = rfac * np.sin(u)
+        z = v_col * np.sin(half_u)
+        return x, y, z
+    
+    def get_edge_points(self, which: str = 'both') -> np.ndarray:
+        """
+        Get the coordinates of points along the edges of the Mobius strip.
+        
+        Args:
+            which (str, optional): 'first' for the v = -w/2 edge, 'second' for
+                the v = w/2 edge, or 'both'.
         
-        return (edge1_x, edge1_y, edge1_z), (edge2_x, edge2_y, edge2_z)
+        Returns:
+            np.ndarray: Edge points of shape (3, N) holding the (x, y, z) rows
+            of a single edge, or (2, 3, N) for both edges.
+        """
+        # Edge indices are the first and last rows, i.e. v = -w/2 and v = w/2
+        if which == 'first':
+            row = 0
+        elif which == 'second':
+            row = -1
+        elif which == 'both':
+            row = [0, -1]
+        else:
+            raise ValueError(f"which must be 'first', 'second' or 'both', got {which!r}")
+        
+        return np.stack([self.x[row], self.y[row], self.z[row]], axis=-2)
     
     def calculate_surface_area(self) -> float:
         """
@@ -120,52 +321,65 @@ class MobiusStrip:
         # For the Mobius strip, the surface area element is:
         # dA = |R_u × R_v| du dv
         # where R_u and R_v are partial derivatives of the position vector
+        # with respect to u and v
         
-        # Step 1: Calculate step sizes
-        du = self.u_range[1] - self.u_range[0]
-        dv = self.v_range[1] - self.v_range[0]
-        
-        # Step 2: Calculate partial derivatives
-        # Partial derivative with respect to u
-        R_u_x = -self.v_grid * np.sin(self.u_grid/2) * np.cos(self.u_grid) / 2 - (self.radius + self.v_grid * np.cos(self.u_grid/2)) * np.sin(self.u_grid)
-        R_u_y = -self.v_grid * np.sin(self.u_grid/2) * np.sin(self.u_grid) / 2 + (self.radius + self.v_grid * np.cos(self.u_grid/2)) * np.cos(self.u_grid)
-        R_u_z = self.v_grid * np.cos(self.u_grid/2) / 2
+        key = (self.radius, self.width, self.resolution)
+        if self._area_cache is not None and self._area_cache[0] == key:
+            return self._area_cache[1]
         
-        # Partial derivative with respect to v
-        R_v_x = np.cos(self.u_grid/2) * np.cos(self.u_grid)
-        R_v_y = np.cos(self.u_grid/2) * np.sin(self.u_grid)
-        R_v_z = np.sin(self.u_grid/2)
-        
-        # Step 3: Calculate cross product magnitude
-        cross_x = R_u_y * R_v_z - R_u_z * R_v_y
-        cross_y = R_u_z * R_v_x - R_u_x * R_v_z
-        cross_z = R_u_x * R_v_y - R_u_y * R_v_x
-        
-        cross_magnitude = np.sqrt(cross_x**2 + cross_y**2 + cross_z**2)
-        
-        # Step 4: Numerical integration
-        area = np.sum(cross_magnitude) * du * dv
+        if _area_kernel is not None:
+            # Numba is available: integrate in one fused pass, without
+            # allocating any N x N temporaries
+            area = float(_area_kernel(self.radius, self.v_range, self._cos_hu,
+                                      self._w_u, self._w_v)) * self._dA
+        elif ne is not None:
+            # numexpr evaluates the closed-form integrand (see below) in one
+            # blocked, multi-threaded pass
+            integrand = ne.evaluate(
+                'sqrt((R + v * ch) ** 2 + 0.25 * v * v)',
+                local_dict={'R': self.radius, 'v': self.v_col, 'ch': self._cos_hu}
+            )
+            area = float(np.einsum('ij,ij->', integrand, self._get_weights())) * self._dA
+        else:
+            # Step 1: Evaluate the integrand in closed form
+            # Expanding the cross product of the partial derivatives gives
+            # |R_u × R_v|^2 = (R + v*cos(u/2))^2 + v^2/4,
+            # so its magnitude is hypot(R + v*cos(u/2), v/2). np.hypot fuses
+            # the squares, sum and root into one in-place pass
+            v = self.v_col
+            integrand = v * self._cos_hu
+            integrand += self.radius
+            np.hypot(integrand, 0.5 * v, out=integrand)
+            
+            # Step 2: Numerical integration with the cached Simpson weights
+            area = float(np.einsum('ij,ij->', integrand, self._get_weights())) * self._dA
         
+        self._area_cache = (key, area)
         return area
     
+    def _get_weights(self) -> np.ndarray:
+        """Return the 2-D quadrature weights, building them on first use."""
+        if self._weights is None:
+            self._weights = self._w_v[:, None] * self._w_u[None, :]
+        return self._weights
+    
     def calculate_edge_length(self) -> float:
         """
         Calculate the length of the edge of the Mobius strip.
         
+        The boundary of a Mobius strip is a single closed curve: following
+        v = w/2 once around (u in [0, 2π]) lands on v = -w/2, so the edge is
+        traced by v = w/2 for u in [0, 4π].
+        
         Returns:
             float: The approximate edge length.
         """
-        # Get edge points
-        (edge1_x, edge1_y, edge1_z), _ = self.get_edge_points()
-        
-        # Calculate distances between consecutive points
-        dx = np.diff(edge1_x)
-        dy = np.diff(edge1_y)
-        dz = np.diff(edge1_z)
-        
-        # Sum up the distances to get the total length
-        segment_lengths = np.sqrt(dx**2 + dy**2 + dz**2)
-        total_length = np.sum(segment_lengths)
+        # Along the edge |dR/du|^2 = (R + (w/2)*cos(u/2))^2 + (w/2)^2/4
+        n = 2 * self.resolution
+        u = np.linspace(0, 4 * pi, n, endpoint=False)
+        v_half = self.width / 2
+        integrand = np.hypot(self.radius + v_half * np.cos(u / 2), 0.5 * v_half)
         
-        # The total edge length is the perimeter
-        return total_length * 2 * np.pi / self.resolution
\ No newline at end of file
+        # The integrand is periodic over [0, 4π], where the trapezoidal rule
+        # reduces to the mean and converges very quickly
+        return integrand.mean() * 4 * pi
@@ -2,6 +2,8 @@
 Visualization utilities for the Mobius strip.
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
@@ -9,6 +11,42 @@ from mpl_toolkits.mplot3d import Axes3D
 from .mobius_strip import MobiusStrip
 
 
+def _surface_polys(x: np.ndarray, y: np.ndarray, z: np.ndarray, max_count: int = 50) -> np.ndarray:
+    """
+    Split a grid of surface points into quadrilateral facets.
+    
+    Like plot_surface, the grid is subsampled to at most max_count rows and
+    columns, always keeping the last row and column.
+    
+    Args:
+        x, y, z (np.ndarray): Grid coordinates, each of shape (rows, cols).
+        max_count (int, optional): Maximum number of samples along each axis.
+    
+    Returns:
+        np.ndarray: Facet vertices, shape (n_facets, 4, 3).
+    """
+    rows, cols = x.shape
+    rstride = max(math.ceil(rows / max_count), 1)
+    cstride = max(math.ceil(cols / max_count), 1)
+    row_inds = np.r_[0:rows - 1:rstride, rows - 1]
+    col_inds = np.r_[0:cols - 1:cstride, cols - 1]
+    
+    points = np.stack([x, y, z], axis=-1)[np.ix_(row_inds, col_inds)]
+    polys = np.stack([points[:-1, :-1], points[:-1, 1:],
+                      points[1:, 1:], points[1:, :-1]], axis=2)
+    return polys.reshape(-1, 4, 3)
+
+
+def _set_equal_aspect(ax, mobius: MobiusStrip):
+    """Set equal axis limits around the Mobius strip."""
+    # The strip is centered at the origin and the x/y extent dominates, so
+    # the analytic bounds give the limits without scanning the coordinates
+    x_min, x_max = mobius.bounds[:2]
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(x_min, x_max)
+    ax.set_zlim(x_min, x_max)
+
+
 def plot_mobius_strip(mobius: MobiusStrip, ax=None, cmap='viridis', alpha=0.8, edge_color='red', show_edges=True):
     """
     Plot the Mobius strip using matplotlib.
@@ -28,20 +66,31 @@ def plot_mobius_strip(mobius: MobiusStrip, ax=None, cmap='viridis', alpha=0.8, e
         fig = plt.figure(figsize=(10, 8))
         ax = fig.add_subplot(111, projection='3d')
     
-    # Get coordinates
-    x, y, z = mobius.get_coordinates()
+    # Get coordinates on the coarse display mesh
+    x, y, z = mobius.get_display_coordinates()
     
     # Plot the surface with a colormap based on z values
     surf = ax.plot_surface(x, y, z, cmap=cmap, alpha=alpha, antialiased=True)
     
-    # Add a color bar
-    plt.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
+    # Add a color bar, or point the existing one at the new surface when
+    # replotting on the same axes
+    cbar = getattr(ax, '_mobius_cbar', None)
+    if cbar is not None:
+        cbar.update_normal(surf)
+    else:
+        ax._mobius_cbar = plt.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
     
     # Plot the edges if requested
+    edges = None
     if show_edges:
         edge1, edge2 = mobius.get_edge_points()
-        ax.plot(edge1[0], edge1[1], edge1[2], color=edge_color, linewidth=2)
-        ax.plot(edge2[0], edge2[1], edge2[2], color=edge_color, linewidth=2)
+        line1, = ax.plot(*edge1, color=edge_color, linewidth=2)
+        line2, = ax.plot(*edge2, color=edge_color, linewidth=2)
+        edges = (line1, line2)
+    
+    # Keep the artists around so update_mobius_artist can reuse them
+    ax._mobius_surf = surf
+    ax._mobius_edges = edges
     
     # Set labels and title
     ax.set_xlabel('X')
@@ -50,17 +99,65 @@ def plot_mobius_strip(mobius: MobiusStrip, ax=None, cmap='viridis', alpha=0.8, e
     ax.set_title(f'Mobius Strip (R={mobius.radius}, w={mobius.width})')
     
     # Set equal aspect ratio
-    max_range = np.array([x.max()-x.min(), y.max()-y.min(), z.max()-z.min()]).max() / 2.0
-    mid_x = (x.max()+x.min()) * 0.5
-    mid_y = (y.max()+y.min()) * 0.5
-    mid_z = (z.max()+z.min()) * 0.5
-    ax.set_xlim(mid_x - max_range, mid_x + max_range)
-    ax.set_ylim(mid_y - max_range, mid_y + max_range)
-    ax.set_zlim(mid_z - max_range, mid_z + max_range)
+    _set_equal_aspect(ax, mobius)
     
     return ax
 
 
+def _artist_data(mobius: MobiusStrip):
+    """
+    Compute the surface facets, facet colors and edges drawn for the strip.
+    
+    This only reads the strip and touches no artist, so it can run off the
+    GUI thread.
+    
+    Args:
+        mobius (MobiusStrip): The Mobius strip to draw.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The facet vertices, the
+        mean z value of each facet, and the (2, 3, N) edge points.
+    """
+    x, y, z = mobius.get_display_coordinates()
+    polys = _surface_polys(x, y, z)
+    facet_z = polys[:, :, 2].mean(axis=1)
+    return polys, facet_z, mobius.get_edge_points()
+
+
+def _set_artist_data(ax, mobius: MobiusStrip, polys: np.ndarray,
+                     facet_z: np.ndarray, edges: np.ndarray):
+    """Push precomputed facets and edges into the artists of plot_mobius_strip."""
+    # Replace the surface facets and recolor them by their mean z value
+    ax._mobius_surf.set_verts(polys)
+    ax._mobius_surf.set_array(facet_z)
+    ax._mobius_surf.autoscale()
+    
+    if ax._mobius_edges is not None:
+        for line, edge in zip(ax._mobius_edges, edges):
+            line.set_data_3d(*edge)
+    
+    ax.set_title(f'Mobius Strip (R={mobius.radius}, w={mobius.width})')
+    _set_equal_aspect(ax, mobius)
+
+
+def update_mobius_artist(ax, mobius: MobiusStrip):
+    """
+    Update a Mobius strip previously drawn by plot_mobius_strip in place.
+    
+    The existing surface and edge artists are given the new vertex data, which
+    is much cheaper than clearing the axes and calling plot_surface again.
+    
+    Args:
+        ax (Axes3D): The 3D axes that plot_mobius_strip drew on.
+        mobius (MobiusStrip): The Mobius strip with updated parameters.
+    
+    Returns:
+        Axes3D: The 3D axes with the updated plot.
+    """
+    _set_artist_data(ax, mobius, *_artist_data(mobius))
+    return ax
+
+
 def interactive_plot():
     """
     Create an interactive plot of the Mobius strip with adjustable parameters.
@@ -100,24 +197,74 @@ def interactive_plot():
     plot_mobius_strip(mobius, ax)
     
     # Update properties text
-    def update_properties_text():
+    def set_properties_text(area, edge_length):
+        props_text.set_text(f'Surface Area: {area:.2f}\nEdge Length: {edge_length:.2f}')
+    
+    set_properties_text(mobius.calculate_surface_area(), mobius.calculate_edge_length())
+    
+    # Rebuild the mesh, the display facets and the properties for the given
+    # slider values. This runs on the worker thread and touches no artist
+    def compute_update(radius, width, resolution):
+        mobius.update_parameters(radius=radius, width=width, resolution=resolution)
+        polys, facet_z, edges = _artist_data(mobius)
         area = mobius.calculate_surface_area()
         edge_length = mobius.calculate_edge_length()
-        props_text.set_text(f'Surface Area: {area:.2f}\nEdge Length: {edge_length:.2f}')
+        return polys, facet_z, edges, area, edge_length
     
-    update_properties_text()
+    # All the numerical work runs on a worker thread so the GUI stays
+    # responsive while dragging. At most one job is in flight, and the strip
+    # is only read on the GUI thread once that job has finished.
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = None
+    stale = False
     
-    # Define update function for sliders
-    def update(_):
-        ax.clear()
-        mobius.update_parameters(
-            radius=s_radius.val,
-            width=s_width.val,
-            resolution=int(s_resolution.val)
+    def submit_update():
+        nonlocal pending, stale
+        if pending is not None:
+            # A job is already running; redo it with the latest values once
+            # its result has been drawn
+            stale = True
+            return
+        pending = executor.submit(
+            compute_update,
+            s_radius.val,
+            s_width.val,
+            int(s_resolution.val)
         )
-        plot_mobius_strip(mobius, ax)
-        update_properties_text()
+        result_timer.start()
+    
+    # Poll for the finished job from the GUI thread, which then only pushes
+    # the precomputed arrays into the artists. GUI timers cannot be started
+    # from the worker thread on every backend, hence the polling.
+    def apply_result():
+        nonlocal pending, stale
+        if pending is None or not pending.done():
+            return
+        result_timer.stop()
+        finished, pending = pending, None
+        polys, facet_z, edges, area, edge_length = finished.result()
+        
+        _set_artist_data(ax, mobius, polys, facet_z, edges)
+        set_properties_text(area, edge_length)
         fig.canvas.draw_idle()
+        
+        if stale:
+            stale = False
+            submit_update()
+    
+    result_timer = fig.canvas.new_timer(interval=5)
+    result_timer.add_callback(apply_result)
+    
+    # Dragging a slider fires many events per second, so coalesce them with a
+    # one-shot timer and only redraw once the slider has settled
+    update_timer = fig.canvas.new_timer(interval=50)
+    update_timer.single_shot = True
+    update_timer.add_callback(submit_update)
+    
+    # Define update function for sliders
+    def update(_):
+        update_timer.stop()
+        update_timer.start()
     
     # Define reset function
     def reset(_):
@@ -130,6 +277,7 @@ def interactive_plot():
     s_width.on_changed(update)
     s_resolution.on_changed(update)
     reset_button.on_clicked(reset)
+    fig.canvas.mpl_connect('close_event', lambda _: executor.shutdown(wait=False))
     
     plt.tight_layout()
     plt.subplots_adjust(bottom=0.2)